@@ -7,8 +7,14 @@
 class Post:
     """
     Class to represent a social media post.
+
+    SocialMediaManager stores posts column-wise and builds Post objects only
+    when a query returns them.
     """
 
+    # Declaring fixed attributes so each Post skips its per-instance __dict__
+    __slots__ = ('post_id', 'datetime', 'content', 'author', 'views')
+
     def __init__(self, post_id, datetime, content, author, views):
         """
         Initializes a Post object with provided attributes.
@@ -27,60 +33,131 @@ class Post:
         self.author = author  # Author of the post
         self.views = views  # Number of views the post has received
 
+def _make_slot_function(keys, mask):
+    """
+    Builds the probe function for a table with a fixed key list and mask.
+
+    The key list and mask are bound into the returned function as constants,
+    so each call avoids looking them up on the table. HashTable rebuilds the
+    function whenever it resizes.
+
+    Args:
+        keys (list): Key of each slot, or None for empty slots.
+        mask (int): Table size minus one. The size must be a power of two.
+
+    Returns:
+        function: Function returning the slot holding a key, or the empty slot where it belongs.
+    """
+
+    def slot_function(key):
+        # Probing forward from the home slot until the key or an empty slot is found
+        slot = hash(key) & mask
+        existing_key = keys[slot]
+        while existing_key is not None and existing_key != key:
+            slot = (slot + 1) & mask
+            existing_key = keys[slot]
+        return slot
+
+    return slot_function
+
 class HashTable:
     """
     Hash table implementation for storing posts by datetime.
+
+    Uses open addressing with linear probing over flat key and value lists,
+    so collisions are resolved by scanning neighbouring slots.
     """
 
-    def __init__(self, size=10):
+    def __init__(self, size=16, load_factor=0.5):
         """
         Initializes a HashTable object with a given size.
 
         Args:
-            size (int): Size of the hash table.
+            size (int): Initial size of the hash table. Rounded up to a power of two.
+            load_factor (float): Ratio of entries to slots above which the table doubles.
+                Must be below 1 so probing always reaches an empty slot.
         """
-        # Initializing the size of the hash table and creating an empty table
+        # Rounding the size up to a power of two so the index can be taken with a bit mask
+        size = 1 << max(size - 1, 0).bit_length()
+
+        # Initializing the size of the hash table and creating empty key and value slots
         self.size = size
-        self.table = [None] * size
+        self.mask = size - 1
+        self.keys = [None] * size
+        self.values = [None] * size
 
-    def _hash(self, key):
-        """
-        Hash function to convert a datetime string into an index.
+        # Tracking the number of entries so the table can grow before probe runs get long
+        self.n = 0
+        self.load_factor = load_factor
 
-        Args:
-            key (str): Datetime string.
+        # Building the probe function around the slots and mask
+        self._slot = _make_slot_function(self.keys, self.mask)
 
-        Returns:
-            int: Index for the given key.
+    def _resize(self, new_size):
         """
-        # Calculating the hash value based on the sum of ASCII values of characters in the key
-        hash_value = sum(ord(char) for char in key) % self.size
-        return hash_value
+        Rehashes every entry into a new table.
+
+        Args:
+            new_size (int): Size of the new table. Must be a power of two.
+        """
+        old_keys = self.keys
+        old_values = self.values
+        self.size = new_size
+        self.mask = new_size - 1
+        self.keys = [None] * new_size
+        self.values = [None] * new_size
+
+        # Rebuilding the probe function around the new slots and mask
+        self._slot = _make_slot_function(self.keys, self.mask)
+
+        # Re-inserting every entry under the new mask; keys are already unique
+        keys = self.keys
+        values = self.values
+        mask = self.mask
+        for key, value in zip(old_keys, old_values):
+            if key is None:
+                continue
+            slot = hash(key) & mask
+            while keys[slot] is not None:
+                slot = (slot + 1) & mask
+            keys[slot] = key
+            values[slot] = value
 
     def insert(self, key, value, verbose=False):
         """
         Inserts a key-value pair into the hash table.
 
+        If the key is already present, its value is replaced.
+
         Args:
             key (str): Key for the entry.
             value: Value associated with the key.
             verbose (bool): Whether to print verbose output. Default is False.
         """
-        # Getting the index where the key-value pair will be inserted
-        index = self._hash(key)
-        node = self.table[index]
+        # Finding the slot that holds the key, or the empty slot where it belongs
+        slot = self._slot(key)
 
-        # Handling collision by chaining
-        if node is None:
-            # If there is no collision, insert the key-value pair directly
-            self.table[index] = [(key, value)]
+        # Replacing the value if the key is already in the table
+        if self.keys[slot] is not None:
+            self.values[slot] = value
             if verbose:
+                print(f'{key} updated at {slot}')
+            return
+
+        # Handling collision by linear probing
+        if verbose:
+            index = hash(key) & self.mask
+            if slot == index:
                 print(f'{key} inserted without collision at {index}')
-        else:
-            # If there is a collision, append to the existing chain
-            self.table[index].append((key, value))
-            if verbose:
-                print(f'{key} successfully inserted on chain at {index}')
+            else:
+                print(f'{key} successfully inserted at {slot} after collision at {index}')
+        self.keys[slot] = key
+        self.values[slot] = value
+
+        # Doubling the table once it is fuller than the load factor allows
+        self.n += 1
+        if self.n > self.load_factor * self.size:
+            self._resize(self.size * 2)
 
     def search(self, key, verbose=False):
         """
@@ -93,247 +170,647 @@ class HashTable:
         Returns:
             The value associated with the key, if found. Otherwise, returns None.
         """
-        # Getting the index where the key may be located
-        index = self._hash(key)
-        nodes = self.table[index]
+        # Finding the slot that holds the key, or the empty slot that ends its probe run
+        slot = self._slot(key)
 
-        # Searching for the key in the chain at the calculated index
-        if nodes is not None:
-            for node in nodes:
-                if node[0] == key:
-                    return node[1]
-                if verbose:
-                    print(f'At hash value {index}, "{node[0]}" not equal to target.')
-        return None
+        if verbose:
+            # Reporting every occupied slot passed over before the key
+            index = hash(key) & self.mask
+            while index != slot:
+                print(f'At hash value {index}, "{self.keys[index]}" not equal to target.')
+                index = (index + 1) & self.mask
 
+        return self.values[slot]
 
 
-class BST:
-    """
-    Binary search tree implementation to store posts sorted by datetime.
+import bisect  # Importing bisect for binary search operations
+
+def _range_scan(keys, start, end, key=None):
     """
+    Finds the slice of a sorted sequence that falls within a closed range.
 
-    class Node:
-        """
-        Represents a node in the binary search tree.
-        """
+    Args:
+        keys (list): Sorted keys, or items sorted by key(item).
+        start: The smallest key to include.
+        end: The largest key to include.
+        key (function): Function mapping each item to its key. Default is None, comparing items directly.
 
-        def __init__(self, post):
-            """
-            Initializes a Node object with a post.
+    Returns:
+        tuple: (low, high) such that keys[low:high] are the items in the range.
+    """
+    # Starting the upper search at the lower bound, so it covers fewer keys and never ends below it
+    low = bisect.bisect_left(keys, start, key=key)
+    return low, bisect.bisect_right(keys, end, low, key=key)
 
-            Args:
-                post (Post): The post to be stored in the node.
-            """
-            self.post = post
-            self.left = None
-            self.right = None
+class SortedList:
+    """
+    Sorted list implementation to store post rows sorted by timestamp.
+    """
 
     def __init__(self):
         """
-        Initializes a BST object.
+        Initializes a SortedList object.
         """
-        # Initializing the root of the binary search tree
-        self.root = None
+        # Initializing parallel lists of timestamps and rows, sorted lazily by timestamp
+        self.keys = []
+        self.rows = []
+        self._dirty = False
 
-    def insert(self, post):
+    def insert(self, timestamp, row):
         """
-        Inserts a post into the binary search tree.
+        Inserts a post row into the sorted list.
+
+        Rows are appended and only sorted when the next query needs them.
+        Rows with equal timestamps keep their insertion order.
 
         Args:
-            post (Post): The post to be inserted.
+            timestamp (int): Timestamp of the post in epoch seconds.
+            row (int): Row of the post in the manager's columns.
         """
-        if not self.root:
-            # If the tree is empty, set the post as the root
-            self.root = self.Node(post)
-        else:
-            # Otherwise, insert recursively based on datetime
-            self._insert_recursive(self.root, post)
+        # Marking the list unsorted only when the new row goes before the current last one
+        if self.keys and timestamp < self.keys[-1]:
+            self._dirty = True
+        self.keys.append(timestamp)
+        self.rows.append(row)
 
-    def _insert_recursive(self, current_node, post):
+    def extend(self, timestamps, rows):
         """
-        Recursively inserts a post into the binary search tree.
+        Inserts many post rows into the sorted list at once.
 
         Args:
-            current_node (Node): The current node being processed.
-            post (Post): The post to be inserted.
+            timestamps (list): Timestamps of the posts in epoch seconds.
+            rows (list): Rows of the posts, in the same order as timestamps.
         """
-        if post.datetime < current_node.post.datetime:
-            # If the post's datetime is less than current node's datetime, insert to the left
-            if current_node.left is None:
-                current_node.left = self.Node(post)
-            else:
-                self._insert_recursive(current_node.left, post)
-        else:
-            # If the post's datetime is greater or equal, insert to the right
-            if current_node.right is None:
-                current_node.right = self.Node(post)
-            else:
-                self._insert_recursive(current_node.right, post)
+        # Appending the whole batch and leaving the ordering to one sort at query time
+        if timestamps:
+            self.keys.extend(timestamps)
+            self.rows.extend(rows)
+            self._dirty = True
 
-    def find_posts_in_range(self, start_datetime, end_datetime):
+    def _sort(self):
         """
-        Finds posts within a given datetime range.
-
-        Args:
-            start_datetime (str): The starting datetime of the range.
-            end_datetime (str): The ending datetime of the range.
-
-        Returns:
-            list: List of posts within the given datetime range.
+        Sorts the rows by timestamp after out-of-order inserts.
         """
-        posts = []
-        self._find_posts_in_range_recursive(self.root, start_datetime, end_datetime, posts)
-        return posts
+        # Sorting positions by key; the sort is stable so equal timestamps keep insertion order
+        order = sorted(range(len(self.keys)), key=self.keys.__getitem__)
+        self.keys = [self.keys[i] for i in order]
+        self.rows = [self.rows[i] for i in order]
+        self._dirty = False
 
-    def _find_posts_in_range_recursive(self, current_node, start_datetime, end_datetime, posts):
+    def find_rows_in_range(self, start_timestamp, end_timestamp):
         """
-        Recursively finds posts within a given datetime range.
+        Finds post rows within a given timestamp range.
 
         Args:
-            current_node (Node): The current node being processed.
-            start_datetime (str): The starting datetime of the range.
-            end_datetime (str): The ending datetime of the range.
-            posts (list): List to store the found posts.
-        """
-        if current_node is None:
-            return
-
-        if current_node.post.datetime >= start_datetime and current_node.post.datetime <= end_datetime:
-            # If the post's datetime is within the range, add it to the list
-            posts.append(current_node.post)
+            start_timestamp (int): The starting timestamp of the range in epoch seconds.
+            end_timestamp (int): The ending timestamp of the range in epoch seconds.
 
-        if current_node.post.datetime > start_datetime:
-            # Recursively search in the left subtree if necessary
-            self._find_posts_in_range_recursive(current_node.left, start_datetime, end_datetime, posts)
+        Returns:
+            list: List of rows within the given timestamp range, sorted by timestamp.
+        """
+        if self._dirty:
+            self._sort()
 
-        if current_node.post.datetime < end_datetime:
-            # Recursively search in the right subtree if necessary
-            self._find_posts_in_range_recursive(current_node.right, start_datetime, end_datetime, posts)
+        # Binary searching for both ends of the range and slicing out the rows in between
+        low, high = _range_scan(self.keys, start_timestamp, end_timestamp)
+        return self.rows[low:high]
 
 import heapq  # Importing heapq for priority queue operations
 
 class MaxHeap:
     """
-    Max heap implementation to store posts sorted by views.
+    Max heap implementation to store post rows sorted by views.
+
+    Entries are (-views, row) tuples, so posts with equal views are ordered
+    by row and comparisons never reach anything but integers.
     """
 
     def __init__(self):
         """
         Initializes a MaxHeap object.
         """
-        # Initializing an empty heap
+        # Initializing an empty heap and a buffer of entries not yet added to it
         self.heap = []
+        self._buf = []
 
-    def insert(self, post):
+    def insert(self, views, row):
         """
-        Inserts a post into the max heap.
+        Inserts a post row into the max heap.
+
+        The entry is buffered and only added to the heap by the next query.
 
         Args:
-            post (Post): The post to be inserted.
+            views (int): Number of views the post has received.
+            row (int): Row of the post in the manager's columns.
+        """
+        # Buffering the row based on its views; ties fall back to the row number
+        self._buf.append((-views, row))
+
+    def extend(self, views, rows):
         """
-        # Inserting the post into the heap based on its views
-        heapq.heappush(self.heap, (-post.views, post))
+        Inserts many post rows into the max heap at once.
+
+        Args:
+            views (list): Number of views of each post.
+            rows (list): Rows of the posts, in the same order as views.
+        """
+        self._buf.extend([(-post_views, row) for post_views, row in zip(views, rows)])
+
+    def _flush(self):
+        """
+        Moves buffered entries into the heap.
+        """
+        if not self._buf:
+            return
+        if len(self._buf) * len(self.heap).bit_length() < len(self.heap):
+            # Pushing a few entries onto a large heap is cheaper than rebuilding it
+            for entry in self._buf:
+                heapq.heappush(self.heap, entry)
+        else:
+            # Otherwise adding the whole buffer and restoring the heap property with a single heapify
+            self.heap.extend(self._buf)
+            heapq.heapify(self.heap)
+        self._buf.clear()
 
     def extract_max(self):
         """
-        Extracts the post with the maximum views from the max heap.
+        Extracts the row with the maximum views from the max heap.
 
         Returns:
-            Post: The post with the maximum views.
+            int: Row of the post with the maximum views.
         """
+        self._flush()
         if not self.heap:
             raise IndexError("Cannot extract from an empty heap")
         return heapq.heappop(self.heap)[1]
 
     def peek_max(self):
         """
-        Returns the post with the maximum views without removing it from the heap.
+        Returns the row with the maximum views without removing it from the heap.
 
         Returns:
-            Post or None: The post with the maximum views, or None if the heap is empty.
+            int or None: Row of the post with the maximum views, or None if the heap is empty.
         """
+        self._flush()
         if not self.heap:
             return None
         return self.heap[0][1]
 
-    def display_sorted(self):
+    def sorted_rows(self):
         """
-        Displays the posts in the heap sorted by views.
+        Returns the rows in the heap sorted by views.
+
+        Returns:
+            list: Rows ordered from most to least viewed.
         """
-        # Sorting the heap based on views and displaying the posts
-        sorted_heap = sorted(self.heap, key=lambda x: x[1].views, reverse=True)
-        for _, post in sorted_heap:
-            # Printing post details
-            print(f"Post: {post.content} by {post.author}, Views: {post.views}")
+        self._flush()
+
+        # Sorting the (-views, row) tuples directly; ties are ordered by row without a key function
+        return [row for _, row in sorted(self.heap)]
 
 
+import sys  # Importing sys for batched output
+from array import array  # Importing array for typed column storage
+from datetime import datetime as DateTime, timezone  # Importing datetime for timestamp parsing
+
+_SECONDS_PER_DAY = 86400
+
+def _to_timestamp(datetime):
+    """
+    Converts a datetime string into an integer timestamp.
+
+    Args:
+        datetime (str): Datetime string such as "2024-04-13 01:00:00".
+
+    Returns:
+        int: Seconds since the Unix epoch. Datetimes without a UTC offset are treated as UTC.
+    """
+    parsed = DateTime.fromisoformat(datetime)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp())
+
 class SocialMediaManager:
     """
     Class to manage social media posts.
+
+    Posts are stored column-wise, one list or typed array per field, and the
+    hash table, sorted list and max heap index into those columns by row.
+    The numeric fields that queries rank and filter on are kept in typed
+    arrays, apart from the string fields, which are only read for the rows
+    a query returns.
     """
     def __init__(self):
         """
         Initializes a SocialMediaManager object with data structures to store posts.
         """
-        # Initializing hash table, binary search tree, and max heap
+        # Initializing the hot columns: fixed-width integers searched and ranked by queries
+        self.timestamps = array('q')
+        self.views = array('q')
+        self.post_ids = array('q')
+        self.author_ids = array('i')
+
+        # Initializing the cold columns: strings read only when a post is returned or displayed
+        self.datetimes = []
+        self.contents = []
+
+        # Interning author names, so each post stores a small author id instead of a string
+        self.author_names = []
+        self._author_ids_by_name = {}
+
+        # Indexing rows by their UTC day (timestamp // _SECONDS_PER_DAY) for day-granularity queries
+        self._rows_by_day = {}
+        self._unsorted_days = set()
+
+        # Initializing the Post object for each row, built the first time a query returns it
+        self.posts = []
+
+        # Initializing hash table, sorted list, and max heap
         self.hash_table = HashTable()
-        self.bst = BST()
+        self.sorted_posts = SortedList()
         self.posts_heap = MaxHeap()
 
+    def _author_id(self, author):
+        """
+        Returns the id of an author, assigning a new one on first sight.
+
+        Args:
+            author (str): Author name.
+
+        Returns:
+            int: Index of the author in author_names.
+        """
+        author_id = self._author_ids_by_name.setdefault(author, len(self.author_names))
+        if author_id == len(self.author_names):
+            self.author_names.append(author)
+        return author_id
+
+    def _author(self, row):
+        """
+        Returns the author name of a row.
+
+        Args:
+            row (int): Row of the post.
+
+        Returns:
+            str: Author of the post.
+        """
+        return self.author_names[self.author_ids[row]]
+
+    def _post(self, row):
+        """
+        Returns the Post object for a row of the columns.
+
+        The Post is built on first use and the same object is returned afterwards.
+
+        Args:
+            row (int): Row of the post.
+
+        Returns:
+            Post: The post stored at that row.
+        """
+        post = self.posts[row]
+        if post is None:
+            post = Post(self.post_ids[row], self.datetimes[row], self.contents[row],
+                        self._author(row), self.views[row])
+            self.posts[row] = post
+        return post
+
     def add_post(self, post_id, datetime, content, author, views):
         """
         Adds a post to the social media manager.
+
+        Returns:
+            int: Row of the new post.
+        """
+        # Parsing the datetime and checking the integer fields before touching any column,
+        # so a bad value raises without leaving the columns misaligned
+        timestamp = _to_timestamp(datetime)
+        post_id, views = array('q', (post_id, views))
+        author_id = self._author_id(author)
+
+        # Appending the post's fields to the columns
+        row = len(self.post_ids)
+        self.post_ids.append(post_id)
+        self.datetimes.append(datetime)
+        self.timestamps.append(timestamp)
+        self.contents.append(content)
+        self.author_ids.append(author_id)
+        self.views.append(views)
+        self.posts.append(None)
+
+        # Inserting the row into hash table, sorted list, day index, and max heap
+        self.hash_table.insert(datetime, row)
+        self.sorted_posts.insert(timestamp, row)
+        self._index_day(timestamp, row)
+        self.posts_heap.insert(views, row)
+        return row
+
+    def add_posts_bulk(self, posts):
+        """
+        Adds many posts to the social media manager at once.
+
+        Args:
+            posts (iterable): (post_id, datetime, content, author, views) tuples.
+
+        Returns:
+            range: Rows of the new posts.
+        """
+        first_row = len(self.post_ids)
+        batch = list(posts)
+        if not batch:
+            return range(first_row, first_row)
+
+        # Checking every tuple has exactly five fields, since zip would silently truncate longer ones
+        for post in batch:
+            if len(post) != 5:
+                raise TypeError(f"Expected (post_id, datetime, content, author, views), got {post!r}")
+
+        # Transposing the batch into one sequence per field and building the typed batches
+        # before touching any column, so a bad value raises without leaving them misaligned
+        post_ids, datetimes, contents, authors, views = zip(*batch)
+        timestamps = array('q', [_to_timestamp(datetime) for datetime in datetimes])
+        post_ids = array('q', post_ids)
+        views = array('q', views)
+        author_ids = array('i', [self._author_id(author) for author in authors])
+
+        # Extending the columns
+        rows = range(first_row, first_row + len(batch))
+        self.post_ids.extend(post_ids)
+        self.datetimes.extend(datetimes)
+        self.timestamps.extend(timestamps)
+        self.contents.extend(contents)
+        self.author_ids.extend(author_ids)
+        self.views.extend(views)
+        self.posts.extend([None] * len(batch))
+
+        # Inserting the rows into hash table, day index, sorted list, and max heap
+        for datetime, timestamp, row in zip(datetimes, timestamps, rows):
+            self.hash_table.insert(datetime, row)
+            self._index_day(timestamp, row)
+        self.sorted_posts.extend(timestamps, rows)
+        self.posts_heap.extend(views, rows)
+        return rows
+
+    def _index_day(self, timestamp, row):
+        """
+        Adds a row to its day bucket.
+
+        Rows are appended and the bucket is only sorted when the next query needs it.
+
+        Args:
+            timestamp (int): Timestamp of the post in epoch seconds.
+            row (int): Row of the post, already present in the columns.
         """
-        # Creating a Post object and inserting it into hash table, binary search tree, and max heap
-        post = Post(post_id, datetime, content, author, views)
-        self.hash_table.insert(datetime, post)
-        self.bst.insert(post)
-        self.posts_heap.insert(post)
+        day = timestamp // _SECONDS_PER_DAY
+        bucket = self._rows_by_day.setdefault(day, [])
 
-    def get_post_by_datetime(self, datetime):
+        # Marking the bucket unsorted only when the new row goes before the current last one
+        if bucket and timestamp < self.timestamps[bucket[-1]]:
+            self._unsorted_days.add(day)
+        bucket.append(row)
+
+    def _day_bucket(self, day):
+        """
+        Returns the rows of a day bucket sorted by timestamp.
+
+        Rows with equal timestamps keep their insertion order.
+
+        Args:
+            day (int): Day number, timestamp // _SECONDS_PER_DAY.
+
+        Returns:
+            list: The bucket itself, or an empty list if the day has no posts.
+        """
+        bucket = self._rows_by_day.get(day, [])
+        if day in self._unsorted_days:
+            # Sorting once after out-of-order inserts; the sort is stable so ties keep insertion order
+            bucket.sort(key=self.timestamps.__getitem__)
+            self._unsorted_days.discard(day)
+        return bucket
+
+    def _query_by_datetime(self, datetime):
+        """
+        Finds the row of the post with a given datetime.
+
+        Returns:
+            int or None: Row of the post, or None if there is none.
+        """
+        return self.hash_table.search(datetime)
+
+    def _query_range(self, start_datetime, end_datetime):
+        """
+        Finds the rows of the posts within a given datetime range.
+
+        Returns:
+            list: Rows within the range, sorted by datetime.
+        """
+        # Converting the bounds once so the sorted list only compares integers
+        start_timestamp = _to_timestamp(start_datetime)
+        end_timestamp = _to_timestamp(end_datetime)
+
+        day = start_timestamp // _SECONDS_PER_DAY
+        if day == end_timestamp // _SECONDS_PER_DAY:
+            # Binary searching that day's sorted bucket, which avoids sorting the whole list
+            # after out-of-order inserts
+            bucket = self._day_bucket(day)
+            low, high = _range_scan(bucket, start_timestamp, end_timestamp,
+                                    key=self.timestamps.__getitem__)
+            return bucket[low:high]
+        return self.sorted_posts.find_rows_in_range(start_timestamp, end_timestamp)
+
+    def _query_day(self, day):
+        """
+        Finds the rows of the posts on a given day.
+
+        Args:
+            day (str): UTC date such as "2024-04-14".
+
+        Returns:
+            list: Rows on that day, sorted by datetime.
+        """
+        # Copying the sorted bucket
+        day = _to_timestamp(day) // _SECONDS_PER_DAY
+        return list(self._day_bucket(day))
+
+    def _query_max(self):
+        """
+        Finds the row of the most viewed post.
+
+        Returns:
+            int or None: Row of the post, or None if there are no posts.
+        """
+        return self.posts_heap.peek_max()
+
+    def _query_top_k(self, k):
+        """
+        Finds the rows of the k most viewed posts.
+
+        Returns:
+            list: Up to k rows ordered from most to least viewed, ties by row.
+        """
+        # Selecting straight from the views column, which is O(N log k) instead of a full sort
+        return heapq.nlargest(k, range(len(self.views)), key=self.views.__getitem__)
+
+    def _display(self, lines):
+        """
+        Writes lines of output with a single write call.
+
+        Args:
+            lines (list): Lines to write, without trailing newlines.
+        """
+        sys.stdout.write('\n'.join(lines) + '\n')
+
+    def _post_details(self, heading, row):
+        """
+        Formats the details of a post under a heading.
+
+        Returns:
+            list: Lines describing the post.
+        """
+        return [
+            f"\n{heading}",
+            f"DateTime: {self.datetimes[row]}",
+            f"Post: {self.contents[row]}",
+            f"Poster: {self._author(row)}",
+            f"Views: {self.views[row]}",
+        ]
+
+    def _post_summary(self, row):
+        """
+        Formats a post as a single line.
+
+        Returns:
+            str: Line describing the post.
+        """
+        return f"ID: {self.post_ids[row]}, DateTime: {self.datetimes[row]}, Post: {self.contents[row]}, Poster: {self._author(row)}, Views: {self.views[row]}"
+
+    def _views_summary(self, row):
+        """
+        Formats a post's content, author and views as a single line.
+
+        Returns:
+            str: Line describing the post's views.
+        """
+        return f"Post: {self.contents[row]} by {self._author(row)}, Views: {self.views[row]}"
+
+    def get_post_by_datetime(self, datetime, verbose=False):
         """
         Retrieves a post by its datetime.
+
+        Args:
+            datetime (str): Datetime of the post.
+            verbose (bool): Whether to print the post's details. Default is False.
+
+        Returns:
+            Post or None: The post, or None if there is none.
         """
-        # Searching for the post in the hash table and displaying its details if found
-        post_by_datetime = self.hash_table.search(datetime)
-        if post_by_datetime:
-            print("\nPost found by datetime:")
-            print(f"DateTime: {post_by_datetime.datetime}")
-            print(f"Post: {post_by_datetime.content}")
-            print(f"Poster: {post_by_datetime.author}")
-            print(f"Views: {post_by_datetime.views}")
-        else:
-            print("Post not found")
-        return post_by_datetime
+        # Searching for the post in the hash table and displaying its details if requested
+        row = self._query_by_datetime(datetime)
+        if verbose:
+            if row is None:
+                self._display(["Post not found"])
+            else:
+                self._display(self._post_details("Post found by datetime:", row))
+        return None if row is None else self._post(row)
 
-    def find_posts_in_range(self, start_datetime, end_datetime):
+    def find_posts_in_range(self, start_datetime, end_datetime, verbose=False):
         """
         Finds posts within a given datetime range.
+
+        Args:
+            start_datetime (str): The starting datetime of the range.
+            end_datetime (str): The ending datetime of the range.
+            verbose (bool): Whether to print the posts' details. Default is False.
+
+        Returns:
+            list: Posts within the range, sorted by datetime.
+        """
+        # Finding rows within the range and displaying their details if requested
+        rows_in_range = self._query_range(start_datetime, end_datetime)
+        if verbose:
+            if rows_in_range:
+                lines = ["\nPosts found in range:"]
+                for row in rows_in_range:
+                    lines.append(self._post_summary(row))
+                self._display(lines)
+            else:
+                self._display(["No posts found in range"])
+        return [self._post(row) for row in rows_in_range]
+
+    def find_posts_on_day(self, day, verbose=False):
         """
-        # Finding posts within the range in the binary search tree and displaying their details
-        posts_in_range = self.bst.find_posts_in_range(start_datetime, end_datetime)
-        if posts_in_range:
-            print("\nPosts found in range:")
-            for post in posts_in_range:
-                print(f"ID: {post.post_id}, DateTime: {post.datetime}, Post: {post.content}, Poster: {post.author}, Views: {post.views}")
-        else:
-            print("No posts found in range")
+        Finds posts made on a given day.
 
-    def get_most_viewed_post(self):
+        Args:
+            day (str): UTC date such as "2024-04-14".
+            verbose (bool): Whether to print the posts' details. Default is False.
+
+        Returns:
+            list: Posts on that day, sorted by datetime.
+        """
+        rows_on_day = self._query_day(day)
+        if verbose:
+            if rows_on_day:
+                lines = [f"\nPosts found on {day}:"]
+                for row in rows_on_day:
+                    lines.append(self._post_summary(row))
+                self._display(lines)
+            else:
+                self._display([f"No posts found on {day}"])
+        return [self._post(row) for row in rows_on_day]
+
+    def get_most_viewed_post(self, verbose=False):
         """
         Retrieves the most viewed post.
+
+        Args:
+            verbose (bool): Whether to print the post's details. Default is False.
+
+        Returns:
+            Post or None: The most viewed post, or None if there are no posts.
         """
-        # Getting the most viewed post from the max heap and displaying its details
-        most_viewed_post = self.posts_heap.peek_max()
-        if most_viewed_post:
-            print("\nMost viewed post:")
-            print(f"DateTime: {most_viewed_post.datetime}")
-            print(f"Post: {most_viewed_post.content}")
-            print(f"Poster: {most_viewed_post.author}")
-            print(f"Views: {most_viewed_post.views}")
-        else:
-            print("No posts available")
+        # Getting the most viewed row from the max heap and displaying its details if requested
+        row = self._query_max()
+        if verbose:
+            if row is None:
+                self._display(["No posts available"])
+            else:
+                self._display(self._post_details("Most viewed post:", row))
+        return None if row is None else self._post(row)
+
+    def top_k(self, k, verbose=False):
+        """
+        Retrieves the k most viewed posts.
+
+        Unlike the max heap, this covers every stored post, including ones
+        removed with extract_most_viewed_post.
+
+        Args:
+            k (int): Number of posts to return.
+            verbose (bool): Whether to print the posts. Default is False.
+
+        Returns:
+            list: Up to k posts ordered from most to least viewed.
+        """
+        rows = self._query_top_k(k)
+        if verbose and rows:
+            self._display([self._views_summary(row) for row in rows])
+        return [self._post(row) for row in rows]
+
+    def extract_most_viewed_post(self):
+        """
+        Removes the most viewed post from the max heap and returns it.
+        """
+        return self._post(self.posts_heap.extract_max())
+
+    def display_sorted_by_views(self):
+        """
+        Displays the posts in the max heap sorted by views.
+        """
+        rows = self.posts_heap.sorted_rows()
+        if rows:
+            self._display([self._views_summary(row) for row in rows])
 
 if __name__ == "__main__":
     # Create a social media manager
@@ -349,43 +826,81 @@ if __name__ == "__main__":
     
     #Hash test cases  
     print('1- Test retrieving a post by datetime (output - Post found by datetime)')
-    post_by_datetime = social_media_manager.get_post_by_datetime("2024-04-13 01:00:00")
+    post_by_datetime = social_media_manager.get_post_by_datetime("2024-04-13 01:00:00", verbose=True)
 
     print('2- Test retrieving a non-existent post by datetime (output - Post not found)')
-    post_by_datetime = social_media_manager.get_post_by_datetime("2024-04-16 11:00:00")
+    post_by_datetime = social_media_manager.get_post_by_datetime("2024-04-16 11:00:00", verbose=True)
     
     print('3- Test retrieving a post by datetime from a collison (output - Post found by datetime)')
-    post_by_datetime = social_media_manager.get_post_by_datetime("2024-04-14 11:00:00")
+    post_by_datetime = social_media_manager.get_post_by_datetime("2024-04-14 11:00:00", verbose=True)
 
     
-    #BST test cases
+    #Sorted list test cases
     
     print('1-Test finding posts in a range (output - Posts found in range)')
     start_datetime = "2024-04-14 00:00:00"
     end_datetime = "2024-04-15 23:59:59"
-    posts_in_range = social_media_manager.find_posts_in_range(start_datetime, end_datetime)
+    posts_in_range = social_media_manager.find_posts_in_range(start_datetime, end_datetime, verbose=True)
 
     print("2-Test finding posts in a range where no posts exist (output - No posts found in range)")
     start_datetime = "2024-04-16 00:00:00"
     end_datetime = "2024-04-17 00:00:00"
-    posts_in_range = social_media_manager.find_posts_in_range(start_datetime, end_datetime)
+    posts_in_range = social_media_manager.find_posts_in_range(start_datetime, end_datetime, verbose=True)
     
     print("3-Test finding posts in a very small range")
     start_datetime = "2024-04-14 11:00:00"
     end_datetime = "2024-04-14 11:00:00"
-    posts_in_range = social_media_manager.find_posts_in_range(start_datetime, end_datetime)
+    posts_in_range = social_media_manager.find_posts_in_range(start_datetime, end_datetime, verbose=True)
     
     #Maxheap test cases
     
     print("1- Test Display the Heap with sorted order of most views:")
-    social_media_manager.posts_heap.display_sorted()
+    social_media_manager.display_sorted_by_views()
     
     print("2-Test extracting the post with the maximum views")
-    pop_post=social_media_manager.posts_heap.extract_max()
+    pop_post=social_media_manager.extract_most_viewed_post()
     print(f"Post: {pop_post.content} by {pop_post.author}, Views: {pop_post.views}")
     
     print("3- Test Display the post with the most views:")
-    social_media_manager.get_most_viewed_post()
+    social_media_manager.get_most_viewed_post(verbose=True)
+    
+    #Bulk load test cases
+    
+    print("1- Test bulk loading posts into a new manager (output - Rows loaded: range(0, 5))")
+    bulk_manager = SocialMediaManager()
+    rows = bulk_manager.add_posts_bulk([
+        (1, "2024-04-13 01:00:00", "Check out this Sunset photo!", "Asma", 100),
+        (2, "2024-04-14 11:00:00", "New Youtube Video", "Brook", 15000),
+        (3, "2024-04-14 18:00:00", "New song released", "Taylor", 22000),
+        (4, "2024-04-15 13:00:00", "Photo dump from my Paris Trip", "Fakhra", 1200),
+        (5, "2024-04-15 02:00:00", "Morning Coffee", "Khalfan", 1000),
+    ])
+    print(f"Rows loaded: {rows}")
+    
+    print("2- Test retrieving a bulk loaded post by datetime (output - Post found by datetime)")
+    post_by_datetime = bulk_manager.get_post_by_datetime("2024-04-15 02:00:00", verbose=True)
+    
+    print("3- Test finding bulk loaded posts in a range (output - Posts found in range, sorted by datetime)")
+    posts_in_range = bulk_manager.find_posts_in_range("2024-04-14 12:00:00", "2024-04-15 23:59:59", verbose=True)
+    
+    #Top k test cases
+    
+    print("1- Test the 3 most viewed posts (output - New song released, New Youtube Video, Photo dump from my Paris Trip)")
+    top_posts = bulk_manager.top_k(3, verbose=True)
+    
+    print("2- Test top k still includes a post extracted from the heap (output - New song released by Taylor, Views: 22000)")
+    top_posts = social_media_manager.top_k(1, verbose=True)
+    
+    #Day index test cases
+    
+    print("1- Test finding posts on a day (output - Posts found on 2024-04-14)")
+    posts_on_day = bulk_manager.find_posts_on_day("2024-04-14", verbose=True)
+    
+    print("2- Test finding posts on a day with no posts (output - No posts found on 2024-04-16)")
+    posts_on_day = bulk_manager.find_posts_on_day("2024-04-16", verbose=True)
+    
+    print("3- Test finding posts in a range within one day (output - Posts found in range)")
+    posts_in_range = bulk_manager.find_posts_in_range("2024-04-14 12:00:00", "2024-04-14 23:59:59", verbose=True)
     
     
 